@@ -7,7 +7,9 @@ building on the basic dice rolling and rules modules.
 Major functions include:
 - Character skill checks
 - Opposed checks between characters
+- Batched opposed checks for simulating many duels at once
 - Weapon damage calculation
+- Flattened character stats for repeated lookups
 
 These functions implement game mechanics based on Call of Cthulhu 7th edition rules.
 
@@ -16,11 +18,12 @@ Version: 1.1
 Last Updated: March 31, 2025
 """
 
-from typing import Dict, Tuple, Union
-from src.dice_roll import roll_dice
-from src.coc_rules import success_check
+from typing import Dict, List, Tuple, Union
+from src.dice_roll import roll_dice, roll_percentile_batch, is_valid_dice
+from src.coc_rules import success_check, success_rank_table
 from src.constants import (
     SuccessLevel,
+    SUCCESS_LEVEL_VALUES,
     CharacterSheetKeys,
     DiceConstants,
     ErrorMessages,
@@ -28,6 +31,62 @@ from src.constants import (
     Defaults
 )
 
+# Aliases for the constants used throughout this module
+_PERCENTILE = DiceConstants.StandardDice.PERCENTILE
+_D4 = DiceConstants.StandardDice.D4
+_DB_PLUS_1D4 = DiceConstants.DamageModifiers.DB_PLUS_1D4
+_NAME = CharacterSheetKeys.NAME
+_SKILLS = CharacterSheetKeys.SKILLS
+_ATTRIBUTES = CharacterSheetKeys.ATTRIBUTES
+_DAMAGE = CharacterSheetKeys.WEAPON_DAMAGE
+
+
+class CharacterStats:
+    """
+    Flattened view of a character's attributes and skills.
+
+    Character sheets nest values under separate skills and attributes
+    dictionaries, so every lookup probes up to two dictionaries. This class
+    merges them once into a single table for code that performs many checks
+    against the same character, such as simulations.
+    """
+
+    __slots__ = ("name", "_values")
+
+    def __init__(self, character_data: Dict):
+        """
+        Build the stats table from character sheet data.
+
+        Skills take precedence over attributes with the same name, matching
+        the lookup order of get_skill_value.
+
+        Args:
+            character_data (dict): The character dictionary data
+        """
+        self.name = character_data.get(_NAME, Defaults.UNKNOWN)
+        self._values = {
+            **character_data.get(_ATTRIBUTES, {}),
+            **character_data.get(_SKILLS, {})
+        }
+
+    def get_value(self, skill_name: str) -> int:
+        """
+        Get a skill or attribute value with a single lookup.
+
+        Args:
+            skill_name (str): The name of the skill or attribute to retrieve
+
+        Returns:
+            int: The value of the skill or attribute
+
+        Raises:
+            ValueError: If the skill or attribute doesn't exist for the character
+        """
+        value = self._values.get(skill_name)
+        if value is None:
+            raise ValueError(ErrorMessages.skill_not_found(skill_name))
+        return value
+
 
 def skill_check(character_data: Dict, skill_name: str) -> Tuple[int, SuccessLevel]:
     """
@@ -50,18 +109,18 @@ def skill_check(character_data: Dict, skill_name: str) -> Tuple[int, SuccessLeve
     skill_value = None
 
     # Look in skills first
-    if (CharacterSheetKeys.SKILLS in character_data and 
-            skill_name in character_data[CharacterSheetKeys.SKILLS]):
-        skill_value = character_data[CharacterSheetKeys.SKILLS][skill_name]
+    if (_SKILLS in character_data and 
+            skill_name in character_data[_SKILLS]):
+        skill_value = character_data[_SKILLS][skill_name]
     # If not found in skills, check attributes
-    elif skill_name in character_data[CharacterSheetKeys.ATTRIBUTES]:
-        skill_value = character_data[CharacterSheetKeys.ATTRIBUTES][skill_name]
+    elif skill_name in character_data[_ATTRIBUTES]:
+        skill_value = character_data[_ATTRIBUTES][skill_name]
     # If not found in either location, raise an error
     else:
         raise ValueError(ErrorMessages.skill_not_found(skill_name))
 
     # Perform the dice roll and determine success level
-    roll_result = roll_dice(DiceConstants.StandardDice.PERCENTILE.value)
+    roll_result = roll_dice(_PERCENTILE)
     success_result = success_check(skill_value)
 
     return (roll_result, success_result)
@@ -88,24 +147,15 @@ def opposed_check(char1_data: Dict, char1_skill: str, char2_data: Dict, char2_sk
     char1_roll, char1_success = skill_check(char1_data, char1_skill)
     char2_roll, char2_success = skill_check(char2_data, char2_skill)
 
-    # Map success levels to numerical values for easy comparison
-    success_levels = {
-        SuccessLevel.EXTREME_SUCCESS: 4,
-        SuccessLevel.HARD_SUCCESS: 3,
-        SuccessLevel.REGULAR_SUCCESS: 2,
-        SuccessLevel.FAILURE: 1,
-        SuccessLevel.FUMBLE: 0
-    }
-
-    # Convert success levels to numerical values
-    char1_level = success_levels[char1_success]
-    char2_level = success_levels[char2_success]
+    # Convert success levels to numerical values for easy comparison
+    char1_level = SUCCESS_LEVEL_VALUES[char1_success]
+    char2_level = SUCCESS_LEVEL_VALUES[char2_success]
 
     # Compare success levels
     if char1_level > char2_level:
-        return CharacterUtils.opposed_check_result(char1_data[CharacterSheetKeys.NAME])
+        return CharacterUtils.opposed_check_result(char1_data[_NAME])
     elif char2_level > char1_level:
-        return CharacterUtils.opposed_check_result(char2_data[CharacterSheetKeys.NAME])
+        return CharacterUtils.opposed_check_result(char2_data[_NAME])
     else:
         # If same success level, compare the margins of success
         char1_margin = get_skill_value(char1_data, char1_skill) - char1_roll
@@ -113,16 +163,57 @@ def opposed_check(char1_data: Dict, char1_skill: str, char2_data: Dict, char2_sk
 
         if char1_margin > char2_margin:
             return CharacterUtils.opposed_check_result(
-                char1_data[CharacterSheetKeys.NAME], True
+                char1_data[_NAME], True
             )
         elif char2_margin > char1_margin:
             return CharacterUtils.opposed_check_result(
-                char2_data[CharacterSheetKeys.NAME], True
+                char2_data[_NAME], True
             )
         else:
             return CharacterUtils.TIE_RESULT
 
 
+def opposed_check_batch(skill1: int, skill2: int,
+                        trials: int) -> Tuple[List[int], List[int], List[int]]:
+    """
+    Simulate many independent opposed checks between two skill values.
+
+    Intended for balance analysis, where the same duel is repeated many times.
+    All rolls are drawn up front and each trial is resolved with integer
+    comparisons only, following the same rules as opposed_check.
+
+    Args:
+        skill1 (int): First combatant's skill or attribute value
+        skill2 (int): Second combatant's skill or attribute value
+        trials (int): Number of duels to simulate
+
+    Returns:
+        tuple: Three lists of length trials, (winners, levels1, levels2), where
+            winners holds 1 if the first combatant won, -1 if the second won and
+            0 for a tie, and levels1/levels2 hold each side's SuccessRank
+    """
+    rolls1 = roll_percentile_batch(trials)
+    rolls2 = roll_percentile_batch(trials)
+
+    # Success ranks for every possible roll, so each trial is a tuple lookup
+    ranks1 = success_rank_table(skill1)
+    ranks2 = success_rank_table(skill2)
+
+    levels1 = [ranks1[roll - 1] for roll in rolls1]
+    levels2 = [ranks2[roll - 1] for roll in rolls2]
+
+    winners = []
+    for level1, level2, roll1, roll2 in zip(levels1, levels2, rolls1, rolls2):
+        # Higher success level wins; on equal levels the better margin wins
+        if level1 == level2:
+            difference = (skill1 - roll1) - (skill2 - roll2)
+        else:
+            difference = level1 - level2
+        winners.append((difference > 0) - (difference < 0))
+
+    return (winners, levels1, levels2)
+
+
 def get_skill_value(character_data: Dict, skill_name: str) -> int:
     """
     Helper function to get a skill or attribute value from character data.
@@ -137,11 +228,11 @@ def get_skill_value(character_data: Dict, skill_name: str) -> int:
     Raises:
         ValueError: If the skill or attribute doesn't exist for the character
     """
-    if (CharacterSheetKeys.SKILLS in character_data and 
-            skill_name in character_data[CharacterSheetKeys.SKILLS]):
-        return character_data[CharacterSheetKeys.SKILLS][skill_name]
-    elif skill_name in character_data[CharacterSheetKeys.ATTRIBUTES]:
-        return character_data[CharacterSheetKeys.ATTRIBUTES][skill_name]
+    if (_SKILLS in character_data and 
+            skill_name in character_data[_SKILLS]):
+        return character_data[_SKILLS][skill_name]
+    elif skill_name in character_data[_ATTRIBUTES]:
+        return character_data[_ATTRIBUTES][skill_name]
     else:
         raise ValueError(ErrorMessages.skill_not_found(skill_name))
 
@@ -159,46 +250,45 @@ def roll_damage(weapon_data: Dict) -> Union[int, str]:
     Returns:
         int or str: The calculated damage result or the damage formula if it can't be calculated
     """
-    try:
-        # Try to directly roll the damage formula
-        return roll_dice(weapon_data[CharacterSheetKeys.WEAPON_DAMAGE])
-    except ValueError:
-        # Handle damage formulas that might involve multiple dice expressions
-        damage_formula = weapon_data[CharacterSheetKeys.WEAPON_DAMAGE]
-
-        # Check for addition pattern (e.g., "1D3+1D4")
-        if "+" in damage_formula:
-            parts = damage_formula.split("+")
-            total_damage = 0
-            try:
-                # Roll each part and sum them up
-                for part in parts:
-                    part = part.strip()  # Remove any whitespace
-                    if part:  # Make sure it's not empty
-                        total_damage += roll_dice(part)
-                return total_damage
-            except ValueError:
-                # If any part can't be rolled, return the original formula
-                return damage_formula
-
-        # Check for subtraction pattern (e.g., "2D6-1D4")
-        elif "-" in damage_formula and not damage_formula.startswith("-"):
-            parts = damage_formula.split("-", 1)  # Split only on the first "-"
-            try:
-                base_damage = roll_dice(parts[0].strip())
-                subtracted_damage = roll_dice(parts[1].strip()) if parts[1].strip() else 0
-                return base_damage - subtracted_damage
-            except ValueError:
-                # If any part can't be rolled, return the original formula
-                return damage_formula
-
-        # Handle specific known damage bonus patterns
-        elif DiceConstants.DamageModifiers.DB_PLUS_1D4 in damage_formula:
-            # Split the formula and roll parts separately
-            base_damage = damage_formula.replace(
-                DiceConstants.DamageModifiers.DB_PLUS_1D4, '').strip()
-            bonus_damage = roll_dice(DiceConstants.StandardDice.D4.value)
-            return roll_dice(base_damage) + bonus_damage
-        else:
-            # Return the formula string if we can't parse it
-            return damage_formula
\ No newline at end of file
+    damage_formula = weapon_data[_DAMAGE]
+
+    # Plain dice notation can be rolled directly
+    if is_valid_dice(damage_formula):
+        return roll_dice(damage_formula)
+
+    # Handle damage formulas that might involve multiple dice expressions
+    # Check for addition pattern (e.g., "1D3+1D4")
+    if "+" in damage_formula:
+        # Remove any whitespace and make sure no part is empty
+        parts = [part.strip() for part in damage_formula.split("+") if part.strip()]
+
+        # If any part can't be rolled, return the original formula
+        if not all(is_valid_dice(part) for part in parts):
+            return damage_formula
+
+        # Roll each part and sum them up
+        return sum(roll_dice(part) for part in parts)
+
+    # Check for subtraction pattern (e.g., "2D6-1D4")
+    elif "-" in damage_formula and not damage_formula.startswith("-"):
+        parts = damage_formula.split("-", 1)  # Split only on the first "-"
+        base_part = parts[0].strip()
+        subtracted_part = parts[1].strip()
+
+        # If any part can't be rolled, return the original formula
+        if not is_valid_dice(base_part) or (subtracted_part and not is_valid_dice(subtracted_part)):
+            return damage_formula
+
+        subtracted_damage = roll_dice(subtracted_part) if subtracted_part else 0
+        return roll_dice(base_part) - subtracted_damage
+
+    # Handle specific known damage bonus patterns
+    elif _DB_PLUS_1D4 in damage_formula:
+        # Split the formula and roll parts separately
+        base_damage = damage_formula.replace(_DB_PLUS_1D4, '').strip()
+        if not is_valid_dice(base_damage):
+            return damage_formula
+        return roll_dice(base_damage) + roll_dice(_D4)
+    else:
+        # Return the formula string if we can't parse it
+        return damage_formula
\ No newline at end of file
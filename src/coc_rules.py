@@ -7,6 +7,9 @@ primarily focusing on skill checks and the various success levels.
 The module provides functions for:
 - Improvement checks (used for character development)
 - Success checks (to determine outcome of skill attempts)
+- Success level classification of an existing roll
+- Specialized checkers for repeated checks against a fixed stat
+- Success level histograms for aggregating simulation results
 
 These functions follow the 7th edition Call of Cthulhu rules.
 
@@ -15,13 +18,26 @@ Version: 1.0
 Last Updated: 03/31/2025
 """
 
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Iterable, Tuple
 import src.dice_roll as dr
 from src.constants import (
     SuccessLevel, 
+    SuccessRank,
+    SUCCESS_LEVELS_BY_RANK,
+    SUCCESS_LEVEL_VALUES,
     DiceConstants, 
-    RuleConstants
+    RuleConstants,
+    SystemLimits
 )
 
+# Skill divisors. Rolls are whole numbers, so comparing against the floor
+# division is equivalent to the true division and keeps every comparison in
+# integer arithmetic.
+_FIFTH_VALUE = RuleConstants.SkillDivisors.FIFTH_VALUE
+_HALF_VALUE = RuleConstants.SkillDivisors.HALF_VALUE
+
 def improvement_check(stat: int)-> bool:
     """
     Determines if a character's stat can improve based on a d100 roll.
@@ -35,7 +51,25 @@ def improvement_check(stat: int)-> bool:
     Returns:
         bool: True if the check succeeds (roll > stat), False otherwise.
     """
-    return dr.roll_dice(DiceConstants.StandardDice.PERCENTILE.value, False) > stat
+    return dr.roll_percentile() > stat
+
+def minimum_fumble_roll(stat: int) -> int:
+    """
+    Returns the lowest d100 roll that counts as a fumble for a stat.
+
+    Fumbles occur on 96-100 for stats of 50 or less and only on 100 for
+    stats over 50, so the whole fumble rule reduces to one comparison
+    against this value.
+
+    Args:
+        stat (int): The character's stat or skill value (0-100).
+
+    Returns:
+        int: The minimum fumbling roll (96 or 100).
+    """
+    if stat <= RuleConstants.FumbleBoundaries.FUMBLE_THRESHOLD:
+        return RuleConstants.FumbleBoundaries.FUMBLE_RANGE_LOW
+    return RuleConstants.FumbleBoundaries.FUMBLE_CRITICAL
 
 def success_check(stat: int) -> SuccessLevel:
     """
@@ -56,20 +90,148 @@ def success_check(stat: int) -> SuccessLevel:
         str: One of: "Extreme Success", "Hard Success", "Regular Success", "Failure", or "Fumble"
     """
     # Roll a d100
-    roll = dr.roll_dice(DiceConstants.StandardDice.PERCENTILE.value)
+    roll = dr.roll_percentile()
+
+    return determine_success_level(stat, roll)
+
+def determine_success_level(stat: int, roll: int) -> SuccessLevel:
+    """
+    Determines the level of success for an already rolled d100 result.
+
+    Separated from success_check so that callers rolling many dice at once
+    (such as batch simulations) can classify each roll without re-rolling.
+
+    Args:
+        stat (int): The character's stat or skill value (0-100).
+        roll (int): The d100 roll to classify (1-100).
 
+    Returns:
+        SuccessLevel: The success level achieved by the roll.
+    """
+    return SUCCESS_LEVELS_BY_RANK[determine_success_rank(stat, roll)]
+
+def determine_success_rank(stat: int, roll: int) -> SuccessRank:
+    """
+    Determines the numerical rank of the success level for a d100 roll.
+
+    Args:
+        stat (int): The character's stat or skill value (0-100).
+        roll (int): The d100 roll to classify (1-100).
+
+    Returns:
+        SuccessRank: The rank of the success level achieved by the roll.
+    """
     # Check for Extreme Success (Critical) - 1/5 of skill value
-    if roll <= stat / RuleConstants.SkillDivisors.FIFTH_VALUE:
-        return SuccessLevel.EXTREME_SUCCESS
+    if roll <= stat // _FIFTH_VALUE:
+        return SuccessRank.EXTREME_SUCCESS
     # Check for Hard Success - 1/2 of skill value
-    elif roll <= stat / RuleConstants.SkillDivisors.HALF_VALUE:
-        return SuccessLevel.HARD_SUCCESS
+    elif roll <= stat // _HALF_VALUE:
+        return SuccessRank.HARD_SUCCESS
     # Check for Regular Success - equal to or under skill value
     elif roll <= stat:
-        return SuccessLevel.REGULAR_SUCCESS
+        return SuccessRank.REGULAR_SUCCESS
     # Check for Fumble - 96-100 for skills 50 or less, only 100 for skills over 50
-    elif (stat <= RuleConstants.FumbleBoundaries.FUMBLE_THRESHOLD and RuleConstants.FumbleBoundaries.FUMBLE_RANGE_LOW <= roll) or (stat > RuleConstants.FumbleBoundaries.FUMBLE_THRESHOLD and roll == RuleConstants.FumbleBoundaries.FUMBLE_CRITICAL):
-        return SuccessLevel.FUMBLE
+    elif roll >= minimum_fumble_roll(stat):
+        return SuccessRank.FUMBLE
     # Everything else is a normal failure
     else:
-        return SuccessLevel.FAILURE
\ No newline at end of file
+        return SuccessRank.FAILURE
+
+@lru_cache(maxsize=SystemLimits.MAX_CACHED_SUCCESS_TABLES)
+def success_rank_table(stat: int) -> Tuple[SuccessRank, ...]:
+    """
+    Precomputes the success rank of every possible d100 roll for a stat.
+
+    The thresholds only depend on the stat, so for a fixed stat a check
+    reduces to indexing this table with roll - 1.
+
+    Args:
+        stat (int): The character's stat or skill value (0-100).
+
+    Returns:
+        tuple: 100 success ranks, where index i holds the result of rolling i + 1.
+    """
+    return tuple(determine_success_rank(stat, roll)
+                 for roll in range(1, DiceConstants.PERCENTILE_SIDES + 1))
+
+@lru_cache(maxsize=SystemLimits.MAX_CACHED_SUCCESS_TABLES)
+def success_table(stat: int) -> Tuple[SuccessLevel, ...]:
+    """
+    Precomputes the success level of every possible d100 roll for a stat.
+
+    Args:
+        stat (int): The character's stat or skill value (0-100).
+
+    Returns:
+        tuple: 100 success levels, where index i holds the result of rolling i + 1.
+    """
+    return tuple(SUCCESS_LEVELS_BY_RANK[rank] for rank in success_rank_table(stat))
+
+@lru_cache(maxsize=SystemLimits.MAX_CACHED_SUCCESS_TABLES)
+def make_checker(stat: int) -> Callable[[], SuccessLevel]:
+    """
+    Creates a success check specialized for a fixed stat.
+
+    Useful when the same skill is rolled repeatedly (pursuits, combat rounds):
+    each call of the returned checker is a single roll and table lookup.
+
+    Args:
+        stat (int): The character's stat or skill value (0-100).
+
+    Returns:
+        Callable: A function taking no arguments that behaves like success_check(stat).
+    """
+    table = success_table(stat)
+
+    def checker() -> SuccessLevel:
+        return table[dr.roll_percentile() - 1]
+
+    return checker
+
+class SuccessHistogram:
+    """
+    Accumulates how often each success level occurs across many checks.
+
+    Counts are kept in a list indexed by SuccessRank, so results from
+    opposed_check_batch can be added directly without converting back to
+    SuccessLevel members.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        """Create a histogram with every count at zero."""
+        self.counts = [0] * len(SUCCESS_LEVELS_BY_RANK)
+
+    def add(self, value: int) -> None:
+        """
+        Record a single check result.
+
+        Args:
+            value (int): The SuccessRank of the success level achieved.
+        """
+        self.counts[value] += 1
+
+    def add_batch(self, values: Iterable[int]) -> None:
+        """
+        Record many check results at once.
+
+        Args:
+            values (iterable): SuccessRank values, one per check.
+        """
+        counts = self.counts
+        # Counter tallies the batch in C before folding it into the totals
+        for value, occurrences in Counter(values).items():
+            counts[value] += occurrences
+
+    def count(self, level: SuccessLevel) -> int:
+        """
+        Get the number of checks that achieved a success level.
+
+        Args:
+            level (SuccessLevel): The success level to look up.
+
+        Returns:
+            int: How many recorded checks achieved that level.
+        """
+        return self.counts[SUCCESS_LEVEL_VALUES[level]]
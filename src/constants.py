@@ -19,14 +19,19 @@ Last Updated: March 31, 2025
 """
 
 import re
-from enum import Enum, auto
-from typing import Dict
+from types import MappingProxyType
+from enum import IntEnum, StrEnum
 
 
-class SuccessLevel(Enum):
+class SuccessLevel(StrEnum):
     """
     Enumeration of possible success levels for skill checks in Call of Cthulhu.
 
+    Members subclass str, so they can be compared with, printed as and used
+    in place of their plain string values without any conversion. As a
+    StrEnum, str() and format() return the value through str's own C-level
+    methods rather than a Python __str__ override.
+
     These values determine the outcome of a skill check, from best to worst:
     - EXTREME_SUCCESS: Exceptional success (roll <= skill/5)
     - HARD_SUCCESS: Better than normal success (roll <= skill/2)
@@ -40,9 +45,36 @@ class SuccessLevel(Enum):
     FAILURE = "Failure"
     FUMBLE = "Fumble"
 
-    def __str__(self):
-        """Return the string value when the enum is converted to string."""
-        return self.value
+
+class SuccessRank(IntEnum):
+    """
+    Numerical rank of each success level, from worst to best.
+
+    Ranks compare as plain integers and index SUCCESS_LEVELS_BY_RANK, so rule
+    calculations can work with small ints and only map to a SuccessLevel when
+    returning a result.
+    """
+    FUMBLE = 0
+    FAILURE = 1
+    REGULAR_SUCCESS = 2
+    HARD_SUCCESS = 3
+    EXTREME_SUCCESS = 4
+
+
+# Success levels indexed by their SuccessRank
+SUCCESS_LEVELS_BY_RANK = (
+    SuccessLevel.FUMBLE,
+    SuccessLevel.FAILURE,
+    SuccessLevel.REGULAR_SUCCESS,
+    SuccessLevel.HARD_SUCCESS,
+    SuccessLevel.EXTREME_SUCCESS
+)
+
+# Numerical ranking of each success level, used to compare outcomes.
+# Read-only, since every module shares this single mapping
+SUCCESS_LEVEL_VALUES = MappingProxyType({
+    level: rank for rank, level in enumerate(SUCCESS_LEVELS_BY_RANK)
+})
 
 
 class RuleConstants:
@@ -68,12 +100,21 @@ class RuleConstants:
         FUMBLE_RANGE_HIGH = 100  # Maximum roll for fumble
 
 
+# Regex flags used throughout the application
+class RegexFlags:
+    """
+    Regular expression flags used for pattern matching.
+    """
+    IGNORE_CASE = re.I
+    VERBOSE = re.X
+
+
 class DiceConstants:
     """
     Constants related to dice rolling mechanics.
     """
 
-    class StandardDice(Enum):
+    class StandardDice:
         """
         Standard dice notations used in the game.
         """
@@ -85,6 +126,17 @@ class DiceConstants:
         D12 = "1D12"          # Twelve-sided die
         D20 = "1D20"          # Twenty-sided die
 
+    # Every standard die, in the order they are listed above
+    ALL_STANDARD_DICE = (
+        StandardDice.PERCENTILE,
+        StandardDice.D4,
+        StandardDice.D6,
+        StandardDice.D8,
+        StandardDice.D10,
+        StandardDice.D12,
+        StandardDice.D20
+    )
+
     class DamageModifiers:
         """
         Special damage modifiers used in character sheets.
@@ -92,14 +144,20 @@ class DiceConstants:
         DB_PLUS_1D4 = "+1D4"  # Common damage bonus modifier
         DB_NONE = "None"      # No damage bonus
 
-    # Regular expression pattern for parsing dice notation
-    DICE_PATTERN = r"""^\(?                   # Optional opening parenthesis
-       (\d+)D(\d+)            # Number of dice and sides (e.g., 3D6)
-       (\s?([\+\-])\s?(\d+))? # Optional modifier (e.g., +2, -1)
-       \)?                    # Optional closing parenthesis
-       (\s?\*\s?(\d+))?       # Optional multiplier (e.g., *5)
-       $                      # End of string
-    """
+    PERCENTILE_SIDES = 100  # Number of sides on a percentile die
+
+    # Regular expression source for parsing dice notation, written compactly
+    # so it compiles without re.VERBOSE. Piece by piece:
+    #   ^\(?                    Optional opening parenthesis
+    #   (\d+)D(\d+)             Number of dice and sides (e.g., 3D6)
+    #   (\s?([+\-])\s?(\d+))?   Optional modifier (e.g., +2, -1)
+    #   \)?                     Optional closing parenthesis
+    #   (\s?\*\s?(\d+))?        Optional multiplier (e.g., *5)
+    #   $                       End of string
+    DICE_PATTERN_SRC = r"^\(?(\d+)D(\d+)(\s?([+\-])\s?(\d+))?\)?(\s?\*\s?(\d+))?$"
+
+    # Compiled dice notation pattern, built once at import
+    DICE_PATTERN = re.compile(DICE_PATTERN_SRC, RegexFlags.IGNORE_CASE)
 
 
 class SystemLimits:
@@ -108,6 +166,7 @@ class SystemLimits:
     """
     MAX_DICE_COUNT = 100  # Maximum number of dice to roll at once
     MAX_DICE_SIDES = 100  # Maximum sides on a single die
+    MAX_CACHED_SUCCESS_TABLES = 128  # Per-stat success tables kept in memory
 
 
 class CharacterSheetKeys:
@@ -177,6 +236,7 @@ class UIStrings:
         Strings for displaying character sheets.
         """
         DIVIDER = "=" * 50
+        HEADER_DIVIDER = "\n" + DIVIDER + "\n"
         SECTION_ATTRIBUTES = "\n--- Attributes ---"
         SECTION_SKILLS = "\n--- Skills ---"
         SECTION_WEAPONS = "\n--- Weapons ---"
@@ -185,7 +245,7 @@ class UIStrings:
         @staticmethod
         def format_header(name: str, age: int, occupation: str, nationality: str) -> str:
             """Format the character sheet header."""
-            return (f"\n{UIStrings.CharacterSheet.DIVIDER}\n"
+            return (f"{UIStrings.CharacterSheet.HEADER_DIVIDER}"
                     f"Name: {name}\n"
                     f"Age: {age}\n"
                     f"Occupation: {occupation}\n"
@@ -251,12 +311,16 @@ class CharacterUtils:
     Utility functions for character operations.
     """
 
+    # Opposed check result suffixes, indexed by whether the win was by margin
+    OPPOSED_CHECK_SUFFIXES = (
+        " wins the opposed check!",
+        " wins the opposed check! (Better Margin)"
+    )
+
     @staticmethod
     def opposed_check_result(winner_name: str, by_margin: bool = False) -> str:
         """Format the result of an opposed check."""
-        if by_margin:
-            return f"{winner_name} wins the opposed check! (Better Margin)"
-        return f"{winner_name} wins the opposed check!"
+        return winner_name + CharacterUtils.OPPOSED_CHECK_SUFFIXES[by_margin]
 
     TIE_RESULT = "The opposed check results in a tie"
 
@@ -293,14 +357,6 @@ class Defaults:
     NONE = None
 
 
-# Regex flags used throughout the application
-class RegexFlags:
-    """
-    Regular expression flags used for pattern matching.
-    """
-    IGNORE_CASE = re.I
-    VERBOSE = re.X
-
 class TestConstants:
     """
     Constants used for testing purposes.
@@ -334,10 +390,6 @@ class TestConstants:
     FUMBLE_ROLL_HIGH_SKILL = 100  # Fumble roll for skill > 50
     NEAR_FUMBLE_ROLL = 95         # Roll near fumble threshold but not a fumble for high skill
 
-    # Edge case skills:
-    MIN_SKILL = 0                 # Minimum skill value
-    MAX_SKILL = 100               # Maximum skill value
-
     class CharacterNames:
         """Character names used in tests."""
         CHARACTER_1_NAME = "Alice"
@@ -347,7 +399,7 @@ class TestConstants:
     class SkillValues:
         """Skill value ranges and test values."""
         MIN_SKILL = 0
-        MAX_SKILL = 100
+        MAX_SKILL = RuleConstants.MAX_SKILL_VALUE
         AVERAGE_SKILL = 50
         HIGH_SKILL = 70
         LOW_SKILL = 30
@@ -15,17 +15,28 @@ Version: 1.0
 Last Updated: 03/31/2025
 """
 
-import re
 import random
 import operator
-from typing import TypedDict, List, Union, overload, Literal
+from typing import TypedDict, List, Optional, Tuple, Union, overload, Literal
 from src.constants import (
     DiceConstants, 
-    RegexFlags, 
     ErrorMessages, 
     SystemLimits
 )
 
+# Faces of a percentile die, shared by the batch roller
+_PERCENTILE_FACES = range(1, DiceConstants.PERCENTILE_SIDES + 1)
+
+# Aliases for the dice limits and the dice pattern's match method
+_MAX_DICE_COUNT = SystemLimits.MAX_DICE_COUNT
+_MAX_DICE_SIDES = SystemLimits.MAX_DICE_SIDES
+_match_dice = DiceConstants.DICE_PATTERN.match
+
+# Sides of each standard single die, so rolling one skips parsing entirely
+_STANDARD_DICE_SIDES = {
+    dice: int(dice.partition("D")[2]) for dice in DiceConstants.ALL_STANDARD_DICE
+}
+
 
 class DiceResult(TypedDict):
     '''
@@ -35,6 +46,54 @@ class DiceResult(TypedDict):
     total: int
     rolls: List[int]
 
+
+def parse_dice(dice_string: str) -> Optional[Tuple[int, int, int, int]]:
+    '''
+    Parses a dice string into its numeric components without rolling.
+    Args:
+        dice_string (str): A string representing the dice, such as "(2D6+6)*5".
+    Returns:
+        tuple | None: (number of dice, dice sides, signed modifier, multiplier), or
+            None if the string is not valid dice notation. The multiplier is 1 when
+            the string has none.
+    '''
+    # Fast path for plain "NDK" notation, the most common form, which needs
+    # no modifier or multiplier handling and so no regex match
+    num_part, separator, sides_part = dice_string.partition("D")
+    if separator and num_part.isdecimal() and sides_part.isdecimal():
+        return (int(num_part), int(sides_part), 0, 1)
+
+    match = _match_dice(dice_string)
+
+    if not match:
+        return None
+
+    num_dice = int(match.group(1))
+    dice_sides = int(match.group(2))
+    modifier = int(match.group(5)) if match.group(4) else 0
+    if match.group(4) == "-":
+        modifier = -modifier
+    multiplier = int(match.group(7)) if match.group(6) else 1
+
+    return (num_dice, dice_sides, modifier, multiplier)
+
+
+def is_valid_dice(dice_string: str) -> bool:
+    '''
+    Checks whether a dice string can be rolled by roll_dice without raising.
+    Args:
+        dice_string (str): A string representing the dice to be rolled.
+    Returns:
+        bool: True if the notation is valid, its dice have at least one side
+            and it is within the system limits.
+    '''
+    parsed = parse_dice(dice_string)
+
+    return (parsed is not None
+            and parsed[0] <= _MAX_DICE_COUNT
+            and 1 <= parsed[1] <= _MAX_DICE_SIDES)
+
+
 # First overload: when return_details is False (default)
 @overload
 def roll_dice(dice_string: str, return_details: Literal[False] = False) -> int: ...
@@ -56,35 +115,43 @@ def roll_dice(dice_string: str, return_details: bool = False) -> Union[int, Dice
         ValueError: If the dice string is invalid.
     '''
 
-    # Parse the dice string
-    pattern = DiceConstants.DICE_PATTERN
+    # Standard single dice are rolled straight from the lookup table
+    sides = _STANDARD_DICE_SIDES.get(dice_string)
+    if sides is not None:
+        roll = roll_die(sides)
+        if return_details:
+            return {"total": roll, "rolls": [roll]}
+        return roll
 
-    match = re.search(pattern, dice_string, RegexFlags.VERBOSE | RegexFlags.IGNORE_CASE)
+    # Parse the dice string
+    parsed = parse_dice(dice_string)
 
-    if not match:
+    if parsed is None:
         raise ValueError(f"{ErrorMessages.INVALID_DICE_FORMAT}: '{dice_string}'")
 
-    num_dice = int(match.group(1))
-    dice_sides = int(match.group(2))
-    add_sub = match.group(4)
-    modifier = int(match.group(5)) if match.group(4) else 0
-    multiplier = int(match.group(7)) if match.group(6) else 0
+    num_dice, dice_sides, modifier, multiplier = parsed
 
     # Check to see if the number of dice is within the limit
-    if num_dice > SystemLimits.MAX_DICE_COUNT:
+    if num_dice > _MAX_DICE_COUNT:
         raise ValueError(f"{ErrorMessages.INVALID_DICE_COUNT}: '{dice_string}'")
-    # Check to see if the number of dice sides is within the limit
-    if dice_sides > SystemLimits.MAX_DICE_SIDES:
+    # Check to see if the number of dice sides is within the limits
+    if not 1 <= dice_sides <= _MAX_DICE_SIDES:
         raise ValueError(f"{ErrorMessages.INVALID_DICE_SIDES}: '{dice_string}'")
 
-    # Roll the dice
-    rolls = [random.randint(1, dice_sides) for _ in range(num_dice)]
-    total = sum(rolls)
+    # Roll the dice. A single die takes the roll_die fast path
+    if num_dice == 1:
+        rolls = [roll_die(dice_sides)]
+    elif not dice_sides & (dice_sides - 1):
+        # Power-of-two dice map exactly onto random bits, which skips
+        # random.choices' float scaling and indexing for every die
+        bits = dice_sides.bit_length() - 1
+        rolls = [random.getrandbits(bits) + 1 for _ in range(num_dice)]
+    else:
+        # Other dice are drawn in one random.choices call rather than one
+        # randint call per die
+        rolls = random.choices(range(1, dice_sides + 1), k=num_dice)
     # Calculate the total
-    if add_sub == "+":
-        total += modifier
-    elif add_sub == "-":
-        total -= modifier
+    total = sum(rolls) + modifier
 
     if multiplier > 1:
         total *= multiplier
@@ -93,4 +160,52 @@ def roll_dice(dice_string: str, return_details: bool = False) -> Union[int, Dice
     if return_details:
         return {"total": total, "rolls": rolls}
     else:
-        return total
\ No newline at end of file
+        return total
+
+
+def roll_percentile() -> int:
+    '''
+    Rolls a single percentile die (1D100).
+
+    Skill and improvement checks roll nothing else, so this skips parsing
+    the dice notation that roll_dice would otherwise do on every check.
+    Returns:
+        int: The roll, between 1 and 100.
+    '''
+    return roll_die(DiceConstants.PERCENTILE_SIDES)
+
+
+def roll_percentile_batch(count: int) -> List[int]:
+    '''
+    Rolls many percentile dice (1D100) at once.
+    Args:
+        count (int): The number of percentile dice to roll.
+    Returns:
+        List[int]: The individual rolls, each between 1 and 100.
+    '''
+    # random.choices draws the whole batch in a single call rather than one
+    # Python-level randint call per die
+    return random.choices(_PERCENTILE_FACES, k=count)
+
+
+def roll_die(dice_sides: int) -> int:
+    '''
+    Rolls a single die.
+
+    Single dice are the most common roll, so this scales one random float
+    rather than going through randint's range checks and rejection loop.
+    The resulting bias is around one part in 2**53, far below anything a
+    game could notice. Dice with a power-of-two number of sides (D2, D4, D8)
+    take the roll straight from random bits, which is exactly uniform.
+    Args:
+        dice_sides (int): The number of sides on the die.
+    Returns:
+        int: The roll, between 1 and dice_sides.
+    Raises:
+        ValueError: If the die has no sides.
+    '''
+    if dice_sides < 1:
+        raise ValueError(f"{ErrorMessages.INVALID_DICE_SIDES}: {dice_sides}")
+    if not dice_sides & (dice_sides - 1):
+        return random.getrandbits(dice_sides.bit_length() - 1) + 1
+    return int(random.random() * dice_sides) + 1
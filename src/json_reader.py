@@ -8,6 +8,7 @@ Last Updated: 3/31/2025
 """
 
 import json
+import sys
 from src.constants import (
     FileConstants,
     UIStrings,
@@ -15,6 +16,22 @@ from src.constants import (
     Defaults
 )
 
+def _intern_keys(pairs):
+    """
+    Build a dictionary from decoded JSON key/value pairs with interned keys.
+
+    Keys decoded from JSON are fresh string objects, while the lookup keys in
+    CharacterSheetKeys are interned literals. Interning the decoded keys lets
+    every later dictionary lookup match on object identity.
+
+    Args:
+        pairs (list): The (key, value) pairs of one decoded JSON object
+
+    Returns:
+        dict: The decoded object with interned keys
+    """
+    return {sys.intern(key): value for key, value in pairs}
+
 def load_character_from_json(filename):
     """
     Load a premade character from a JSON file.
@@ -35,7 +52,7 @@ def load_character_from_json(filename):
         raise ValueError(f"File must have a {FileConstants.JSON_EXTENSION} extension")
 
     with open(filename, FileConstants.READ_MODE) as f:
-        character_data = json.load(f)
+        character_data = json.load(f, object_pairs_hook=_intern_keys)
     return character_data
 
 def display_character(character_data):
@@ -52,40 +69,49 @@ def display_character(character_data):
     Args:
         character_data (dict): Dictionary containing the character data
     """
-    # Print divider line and basic character information
-    print(UIStrings.CharacterSheet.DIVIDER)
-    print(UIStrings.CharacterSheet.format_header(
-        character_data[CharacterSheetKeys.NAME],
-        character_data[CharacterSheetKeys.AGE],
-        character_data.get(CharacterSheetKeys.OCCUPATION, Defaults.UNKNOWN),
-        character_data.get(CharacterSheetKeys.NATIONALITY, Defaults.UNKNOWN)
-    ))
-
-    # Print character attributes
-    print(UIStrings.CharacterSheet.SECTION_ATTRIBUTES)
-    for attr, value in character_data[CharacterSheetKeys.ATTRIBUTES].items():
-        print(UIStrings.CharacterSheet.format_stat(attr, value))
-
-    # Print character skills if available
+    # Resolve the formatters once rather than per attribute, skill and weapon
+    sheet = UIStrings.CharacterSheet
+    format_stat = sheet.format_stat
+    format_weapon = sheet.format_weapon
+
+    # Collect the sheet line by line, starting with the divider and basic
+    # character information, so it is printed in a single call
+    lines = [
+        sheet.DIVIDER,
+        sheet.format_header(
+            character_data[CharacterSheetKeys.NAME],
+            character_data[CharacterSheetKeys.AGE],
+            character_data.get(CharacterSheetKeys.OCCUPATION, Defaults.UNKNOWN),
+            character_data.get(CharacterSheetKeys.NATIONALITY, Defaults.UNKNOWN)
+        )
+    ]
+
+    # Character attributes
+    lines.append(sheet.SECTION_ATTRIBUTES)
+    lines.extend(format_stat(attr, value)
+                 for attr, value in character_data[CharacterSheetKeys.ATTRIBUTES].items())
+
+    # Character skills if available
     if CharacterSheetKeys.SKILLS in character_data:
-        print(UIStrings.CharacterSheet.SECTION_SKILLS)
-        for skill, value in character_data[CharacterSheetKeys.SKILLS].items():
-            print(UIStrings.CharacterSheet.format_stat(skill, value))
+        lines.append(sheet.SECTION_SKILLS)
+        lines.extend(format_stat(skill, value)
+                     for skill, value in character_data[CharacterSheetKeys.SKILLS].items())
 
-    # Print character weapons if available
+    # Character weapons if available
     if CharacterSheetKeys.WEAPONS in character_data:
-        print(UIStrings.CharacterSheet.SECTION_WEAPONS)
-        for weapon in character_data[CharacterSheetKeys.WEAPONS]:
-            print(UIStrings.CharacterSheet.format_weapon(
-                weapon[CharacterSheetKeys.WEAPON_NAME],
-                weapon[CharacterSheetKeys.WEAPON_SKILL],
-                weapon[CharacterSheetKeys.WEAPON_DAMAGE]
-            ))
-
-    # Print character backstory if available
+        lines.append(sheet.SECTION_WEAPONS)
+        lines.extend(format_weapon(
+            weapon[CharacterSheetKeys.WEAPON_NAME],
+            weapon[CharacterSheetKeys.WEAPON_SKILL],
+            weapon[CharacterSheetKeys.WEAPON_DAMAGE]
+        ) for weapon in character_data[CharacterSheetKeys.WEAPONS])
+
+    # Character backstory if available
     if CharacterSheetKeys.BACKSTORY in character_data:
-        print(UIStrings.CharacterSheet.SECTION_BACKSTORY)
-        print(character_data[CharacterSheetKeys.BACKSTORY])
+        lines.append(sheet.SECTION_BACKSTORY)
+        lines.append(character_data[CharacterSheetKeys.BACKSTORY])
+
+    # Closing divider
+    lines.append(sheet.DIVIDER)
 
-    # Print closing divider
-    print(UIStrings.CharacterSheet.DIVIDER)
\ No newline at end of file
+    print(Defaults.NEW_LINE.join(lines))
\ No newline at end of file
@@ -40,18 +40,24 @@ def run_character_view(character_files):
     """
     # Display list of available characters
     print(UIStrings.CharacterViewer.TITLE)
+    character_option = UIStrings.CharacterViewer.character_option
     for i, filename in enumerate(character_files, 1):
         # Format the name nicely by removing the file extension
         name = filename.replace(FileConstants.JSON_EXTENSION, Defaults.EMPTY_STRING).capitalize()
-        print(UIStrings.CharacterViewer.character_option(i, name))
+        print(character_option(i, name))
 
     # Add option to return to main menu
-    print(UIStrings.CharacterViewer.return_option(len(character_files) + 1))
+    return_index = len(character_files) + 1
+    print(UIStrings.CharacterViewer.return_option(return_index))
+
+    # The prompt only depends on the number of characters, so build it once
+    # rather than on every retry after invalid input
+    prompt = UIStrings.CharacterViewer.selection_prompt(return_index)
 
     # Let user select a character
     while True:
         try:
-            selection = int(input(UIStrings.CharacterViewer.selection_prompt(len(character_files) + 1)))
+            selection = int(input(prompt))
 
             # Handle valid character selection
             if 1 <= selection <= len(character_files):
@@ -68,7 +74,7 @@ def run_character_view(character_files):
                 input(UIStrings.CharacterViewer.CONTINUE_PROMPT)
                 return character_data
             # Handle return to main menu
-            elif selection == len(character_files) + 1:
+            elif selection == return_index:
                 return None
             else:
                 print(UIStrings.MainMenu.INVALID_CHOICE)
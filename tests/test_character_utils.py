@@ -7,8 +7,15 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from unittest.mock import patch, MagicMock
-from src.character_utils import opposed_check, skill_check, get_skill_value, roll_damage
-from src.constants import SuccessLevel, CharacterSheetKeys, TestConstants
+from src.character_utils import (
+    CharacterStats,
+    opposed_check,
+    opposed_check_batch,
+    skill_check,
+    get_skill_value,
+    roll_damage
+)
+from src.constants import SuccessLevel, SUCCESS_LEVEL_VALUES, CharacterSheetKeys, TestConstants
 
 # === Tests for skill_check function ===
 
@@ -363,6 +370,58 @@ def test_opposed_check_error_handling():
             opposed_check(character1_data, "Stealth", character2_data, "Nonexistent")
 
 
+# === Tests for opposed_check_batch function ===
+
+def test_opposed_check_batch_result_shape():
+    """
+    Test that opposed_check_batch returns one winner and one success level
+    per combatant for every simulated trial.
+    """
+    # Arrange
+    trials = 200
+
+    # Act
+    winners, levels1, levels2 = opposed_check_batch(
+        TestConstants.SkillValues.HIGH_SKILL, TestConstants.SkillValues.LOW_SKILL, trials
+    )
+
+    # Assert
+    assert len(winners) == len(levels1) == len(levels2) == trials
+    assert set(winners) <= {-1, 0, 1}
+    assert set(levels1) <= set(SUCCESS_LEVEL_VALUES.values())
+    assert set(levels2) <= set(SUCCESS_LEVEL_VALUES.values())
+
+def test_opposed_check_batch_levels_and_margins():
+    """
+    Test that opposed_check_batch resolves duels by success level first
+    and by margin of success when both sides reach the same level.
+    """
+    # Arrange - trial 1: Hard vs Failure, trial 2: Regular vs Regular with
+    # a better margin for the second side, trial 3: Regular vs Regular with
+    # identical margins
+    first_rolls = [30, 60, 50]
+    second_rolls = [60, 35, 30]
+    skill1 = TestConstants.SkillValues.HIGH_SKILL       # 70
+    skill2 = TestConstants.SkillValues.AVERAGE_SKILL    # 50
+
+    with patch('src.character_utils.roll_percentile_batch',
+               side_effect=[first_rolls, second_rolls]):
+        # Act
+        winners, levels1, levels2 = opposed_check_batch(skill1, skill2, 3)
+
+    # Assert
+    assert levels1 == [
+        SUCCESS_LEVEL_VALUES[SuccessLevel.HARD_SUCCESS],
+        SUCCESS_LEVEL_VALUES[SuccessLevel.REGULAR_SUCCESS],
+        SUCCESS_LEVEL_VALUES[SuccessLevel.REGULAR_SUCCESS]
+    ]
+    assert levels2 == [
+        SUCCESS_LEVEL_VALUES[SuccessLevel.FAILURE],
+        SUCCESS_LEVEL_VALUES[SuccessLevel.REGULAR_SUCCESS],
+        SUCCESS_LEVEL_VALUES[SuccessLevel.REGULAR_SUCCESS]
+    ]
+    assert winners == [1, -1, 0]
+
 # === Tests for get_skill_value function ===
 
 def test_get_skill_from_skills():
@@ -427,6 +486,54 @@ def test_get_skill_value_error_handling():
     assert "Nonexistent" in str(excinfo.value)
 
 
+# === Tests for CharacterStats class ===
+
+def test_character_stats_lookup():
+    """
+    Test that CharacterStats finds both skills and attributes, preferring
+    skills when a name appears in both, like get_skill_value.
+    """
+    # Arrange
+    character_data = {
+        CharacterSheetKeys.NAME: TestConstants.CharacterNames.TEST_CHARACTER,
+        CharacterSheetKeys.ATTRIBUTES: {
+            "Strength": TestConstants.SkillValues.HIGH_SKILL,
+            "Dodge": TestConstants.SkillValues.LOW_SKILL
+        },
+        CharacterSheetKeys.SKILLS: {
+            "Stealth": TestConstants.SkillValues.AVERAGE_SKILL,
+            "Dodge": TestConstants.SkillValues.HIGH_SKILL
+        }
+    }
+
+    # Act
+    stats = CharacterStats(character_data)
+
+    # Assert
+    assert stats.name == TestConstants.CharacterNames.TEST_CHARACTER
+    assert stats.get_value("Strength") == TestConstants.SkillValues.HIGH_SKILL
+    assert stats.get_value("Stealth") == TestConstants.SkillValues.AVERAGE_SKILL
+    assert stats.get_value("Dodge") == get_skill_value(character_data, "Dodge")
+
+def test_character_stats_missing_value():
+    """
+    Test that CharacterStats raises the same error as get_skill_value
+    for a missing skill or attribute.
+    """
+    # Arrange
+    stats = CharacterStats({
+        CharacterSheetKeys.NAME: TestConstants.CharacterNames.TEST_CHARACTER,
+        CharacterSheetKeys.ATTRIBUTES: {
+            "Strength": TestConstants.SkillValues.HIGH_SKILL
+        }
+    })
+
+    # Act and Assert
+    with pytest.raises(ValueError) as excinfo:
+        stats.get_value("Nonexistent")
+
+    assert "Nonexistent" in str(excinfo.value)
+
 # === Tests for roll_damage function ===
 
 def test_simple_damage_formula():
@@ -500,6 +607,24 @@ def test_damage_formula_with_damage_bonus():
         # Assert
         assert damage == 5
 
+def test_zero_sided_damage_formula():
+    """
+    Test that roll_damage returns a formula with a zero-sided die unrolled
+    rather than raising.
+    """
+    # Arrange
+    weapon_data = {
+        CharacterSheetKeys.WEAPON_NAME: "Broken Weapon",
+        CharacterSheetKeys.WEAPON_SKILL: TestConstants.SkillValues.AVERAGE_SKILL,
+        CharacterSheetKeys.WEAPON_DAMAGE: "1D0"
+    }
+
+    # Act
+    damage = roll_damage(weapon_data)
+
+    # Assert
+    assert damage == "1D0"
+
 def test_unparseable_damage_formula():
     """
     Test that roll_damage correctly handles damage formulas that can't be parsed,
@@ -21,16 +21,26 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from unittest.mock import patch
-from src.coc_rules import improvement_check, success_check
+from src.coc_rules import (
+    improvement_check,
+    success_check,
+    minimum_fumble_roll,
+    determine_success_level,
+    determine_success_rank,
+    success_table,
+    make_checker,
+    SuccessHistogram
+)
 from src.constants import (
     SuccessLevel, 
+    SuccessRank,
+    SUCCESS_LEVELS_BY_RANK,
+    SUCCESS_LEVEL_VALUES,
     TestConstants, 
     RuleConstants,
     DiceConstants
 )
 
-import src.dice_roll as dr
-
 # === Tests for success_check function ===
 
 def test_extreme_success():
@@ -43,7 +53,7 @@ def test_extreme_success():
     expected_result = SuccessLevel.EXTREME_SUCCESS
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=TestConstants.EXTREME_SUCCESS_ROLL):
+    with patch('src.dice_roll.roll_percentile', return_value=TestConstants.EXTREME_SUCCESS_ROLL):
         result = success_check(skill)
 
     # Assert
@@ -60,7 +70,7 @@ def test_hard_success():
     expected_result = SuccessLevel.HARD_SUCCESS
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=TestConstants.HARD_SUCCESS_ROLL):
+    with patch('src.dice_roll.roll_percentile', return_value=TestConstants.HARD_SUCCESS_ROLL):
         result = success_check(skill)
 
     # Assert
@@ -77,7 +87,7 @@ def test_regular_success():
     expected_result = SuccessLevel.REGULAR_SUCCESS
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=TestConstants.REGULAR_SUCCESS_ROLL):
+    with patch('src.dice_roll.roll_percentile', return_value=TestConstants.REGULAR_SUCCESS_ROLL):
         result = success_check(skill)
 
     # Assert
@@ -94,7 +104,7 @@ def test_failure():
     expected_result = SuccessLevel.FAILURE
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=TestConstants.FAILURE_ROLL):
+    with patch('src.dice_roll.roll_percentile', return_value=TestConstants.FAILURE_ROLL):
         result = success_check(skill)
 
     # Assert
@@ -111,7 +121,7 @@ def test_fumble_low_skill():
     expected_result = SuccessLevel.FUMBLE
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=98):
+    with patch('src.dice_roll.roll_percentile', return_value=98):
         result = success_check(skill)
 
     # Assert
@@ -128,7 +138,7 @@ def test_fumble_high_skill():
     expected_result = SuccessLevel.FUMBLE
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=100):
+    with patch('src.dice_roll.roll_percentile', return_value=100):
         result = success_check(skill)
 
     # Assert
@@ -145,7 +155,7 @@ def test_high_skill_not_fumble():
     expected_result = SuccessLevel.FAILURE
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=97):
+    with patch('src.dice_roll.roll_percentile', return_value=97):
         result = success_check(skill)
 
     # Assert
@@ -162,7 +172,7 @@ def test_exact_skill_roll():
     expected_result = SuccessLevel.REGULAR_SUCCESS
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=skill):
+    with patch('src.dice_roll.roll_percentile', return_value=skill):
         result = success_check(skill)
 
     # Assert
@@ -179,7 +189,7 @@ def test_exact_half_skill_roll():
     expected_result = SuccessLevel.HARD_SUCCESS
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=skill // RuleConstants.SkillDivisors.HALF_VALUE):
+    with patch('src.dice_roll.roll_percentile', return_value=skill // RuleConstants.SkillDivisors.HALF_VALUE):
         result = success_check(skill)
 
     # Assert
@@ -196,7 +206,7 @@ def test_exact_fifth_skill_roll():
     expected_result = SuccessLevel.EXTREME_SUCCESS
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=skill // RuleConstants.SkillDivisors.FIFTH_VALUE):
+    with patch('src.dice_roll.roll_percentile', return_value=skill // RuleConstants.SkillDivisors.FIFTH_VALUE):
         result = success_check(skill)
 
     # Assert
@@ -209,55 +219,118 @@ def test_min_skill():
     Everything should be a failure with zero skill.
     """
     # Arrange
-    skill = TestConstants.MIN_SKILL
+    skill = TestConstants.SkillValues.MIN_SKILL
     expected_result = SuccessLevel.FAILURE
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=1):  # Even a roll of 1
+    with patch('src.dice_roll.roll_percentile', return_value=1):  # Even a roll of 1
         result = success_check(skill)
 
     # Assert
     assert result == expected_result
 
 
-def success_check(stat: int) -> SuccessLevel:
+def test_minimum_fumble_roll():
+    """
+    Test that the fumble floor is 96 up to the threshold skill and 100 above it.
+    """
+    # Arrange
+    threshold = RuleConstants.FumbleBoundaries.FUMBLE_THRESHOLD
+
+    # Act & Assert
+    assert minimum_fumble_roll(TestConstants.SkillValues.MIN_SKILL) == RuleConstants.FumbleBoundaries.FUMBLE_RANGE_LOW
+    assert minimum_fumble_roll(threshold) == RuleConstants.FumbleBoundaries.FUMBLE_RANGE_LOW
+    assert minimum_fumble_roll(threshold + 1) == RuleConstants.FumbleBoundaries.FUMBLE_CRITICAL
+
+
+def test_success_level_is_plain_string():
+    """
+    Test that success levels can be used directly as their string values.
+    """
+    # Act & Assert
+    assert SuccessLevel.EXTREME_SUCCESS == "Extreme Success"
+    assert isinstance(SuccessLevel.FUMBLE, str)
+    assert f"{SuccessLevel.HARD_SUCCESS}" == "Hard Success"
+    assert SuccessLevel("Failure") is SuccessLevel.FAILURE
+
+
+def test_success_rank_matches_level():
+    """
+    Test that the rank of a roll indexes the success level it maps to,
+    and that ranks order levels from worst to best.
     """
-    Rolls 1D100 and determines the level of success based on the character's stat.
+    # Arrange
+    skill = TestConstants.SKILL_HARD_THRESHOLD
 
-    According to CoC rules, the success level depends on how much lower the roll is
-    compared to the character's stat:
-    - Extreme Success: roll <= stat/5
-    - Hard Success: roll <= stat/2
-    - Regular Success: roll <= stat
-    - Fumble: special case for very high rolls
-    - Failure: roll > stat (and not a fumble)
+    # Act & Assert
+    for roll in range(1, DiceConstants.PERCENTILE_SIDES + 1):
+        rank = determine_success_rank(skill, roll)
+        assert SUCCESS_LEVELS_BY_RANK[rank] == determine_success_level(skill, roll)
+        assert SUCCESS_LEVEL_VALUES[SUCCESS_LEVELS_BY_RANK[rank]] == rank
+    assert SuccessRank.EXTREME_SUCCESS > SuccessRank.HARD_SUCCESS > SuccessRank.FUMBLE
 
-    Args:
-        stat (int): The character's stat or skill value (0-100).
 
-    Returns:
-        SuccessLevel: One of: EXTREME_SUCCESS, HARD_SUCCESS, REGULAR_SUCCESS, FAILURE, or FUMBLE
+def test_success_level_values_is_read_only():
+    """
+    Test that the shared success level ranking cannot be modified.
     """
-    # Roll a d100
-    roll = dr.roll_dice(DiceConstants.StandardDice.PERCENTILE.value)
+    # Act & Assert
+    with pytest.raises(TypeError):
+        SUCCESS_LEVEL_VALUES[SuccessLevel.FUMBLE] = SuccessRank.EXTREME_SUCCESS
+
+
+def test_success_table_matches_classification():
+    """
+    Test that the precomputed table agrees with determine_success_level
+    for every possible roll.
+    """
+    # Arrange
+    skill = TestConstants.SKILL_HARD_THRESHOLD
 
-    # Check for Extreme Success (Critical) - 1/5 of skill value
-    if roll <= stat / RuleConstants.SkillDivisors.FIFTH_VALUE:
-        return SuccessLevel.EXTREME_SUCCESS
-    # Check for Hard Success - 1/2 of skill value
-    elif roll <= stat / RuleConstants.SkillDivisors.HALF_VALUE:
-        return SuccessLevel.HARD_SUCCESS
-    # Check for Regular Success - equal to or under skill value
-    elif roll <= stat:
-        return SuccessLevel.REGULAR_SUCCESS
-    # Check for Fumble
-    elif (stat <= RuleConstants.FumbleBoundaries.FUMBLE_THRESHOLD and 
-          RuleConstants.FumbleBoundaries.FUMBLE_RANGE_LOW <= roll) or \
-         (stat > RuleConstants.FumbleBoundaries.FUMBLE_THRESHOLD and roll == 100):
-        return SuccessLevel.FUMBLE
-    # Everything else is a normal failure
-    else:
-        return SuccessLevel.FAILURE
+    # Act
+    table = success_table(skill)
+
+    # Assert
+    assert len(table) == DiceConstants.PERCENTILE_SIDES
+    for roll in range(1, DiceConstants.PERCENTILE_SIDES + 1):
+        assert table[roll - 1] == determine_success_level(skill, roll)
+
+
+def test_make_checker_uses_fixed_stat():
+    """
+    Test that a specialized checker classifies its roll against the stat
+    it was created for, and that checkers are reused per stat.
+    """
+    # Arrange
+    checker = make_checker(TestConstants.SKILL_REGULAR_THRESHOLD)
+
+    # Act
+    with patch('src.dice_roll.roll_percentile', return_value=TestConstants.REGULAR_SUCCESS_ROLL):
+        result = checker()
+
+    # Assert
+    assert result == SuccessLevel.REGULAR_SUCCESS
+    assert make_checker(TestConstants.SKILL_REGULAR_THRESHOLD) is checker
+
+
+def test_success_histogram_counts():
+    """
+    Test that SuccessHistogram tallies single results and batches together.
+    """
+    # Arrange
+    histogram = SuccessHistogram()
+    hard = SUCCESS_LEVEL_VALUES[SuccessLevel.HARD_SUCCESS]
+    fumble = SUCCESS_LEVEL_VALUES[SuccessLevel.FUMBLE]
+
+    # Act
+    histogram.add(hard)
+    histogram.add_batch([hard, fumble, fumble])
+
+    # Assert
+    assert histogram.count(SuccessLevel.HARD_SUCCESS) == 2
+    assert histogram.count(SuccessLevel.FUMBLE) == 2
+    assert histogram.count(SuccessLevel.EXTREME_SUCCESS) == 0
+    assert sum(histogram.counts) == 4
 
 
 # === Tests for improvement_check function ===
@@ -270,7 +343,7 @@ def test_improvement_successful():
     stat = 50
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=60):
+    with patch('src.dice_roll.roll_percentile', return_value=60):
         result = improvement_check(stat)
 
     # Assert
@@ -285,7 +358,7 @@ def test_improvement_failed():
     stat = 50
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=40):
+    with patch('src.dice_roll.roll_percentile', return_value=40):
         result = improvement_check(stat)
 
     # Assert
@@ -300,7 +373,7 @@ def test_improvement_equal_to_stat():
     stat = 50
 
     # Act
-    with patch('src.dice_roll.roll_dice', return_value=50):
+    with patch('src.dice_roll.roll_percentile', return_value=50):
         result = improvement_check(stat)
 
     # Assert
@@ -315,12 +388,12 @@ def test_improvement_low_stat():
     stat = 5
 
     # Act - Test with roll 10 (should be success)
-    with patch('src.dice_roll.roll_dice', return_value=10):
+    with patch('src.dice_roll.roll_percentile', return_value=10):
         result = improvement_check(stat)
         assert result == True
 
     # Act - Test with roll 1 (should be failure)
-    with patch('src.dice_roll.roll_dice', return_value=1):
+    with patch('src.dice_roll.roll_percentile', return_value=1):
         result = improvement_check(stat)
         assert result == False
 
@@ -334,11 +407,11 @@ def test_improvement_high_stat():
     stat = 95
 
     # Act - Test with roll 96 (should be success)
-    with patch('src.dice_roll.roll_dice', return_value=96):
+    with patch('src.dice_roll.roll_percentile', return_value=96):
         result = improvement_check(stat)
         assert result == True
 
     # Act - Test with roll 94 (should be failure)
-    with patch('src.dice_roll.roll_dice', return_value=94):
+    with patch('src.dice_roll.roll_percentile', return_value=94):
         result = improvement_check(stat)
         assert result == False
\ No newline at end of file
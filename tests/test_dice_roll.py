@@ -13,6 +13,7 @@ Last Updated: 03/31/2025
 """
 
 import pytest
+import random
 import sys
 import os
 from pathlib import Path
@@ -20,7 +21,8 @@ from pathlib import Path
 # Add project root to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.dice_roll import roll_dice
+from unittest.mock import patch
+from src.dice_roll import roll_dice, roll_percentile, roll_die, parse_dice, is_valid_dice
 from src.constants import (
     DiceConstants, 
     SystemLimits, 
@@ -145,12 +147,23 @@ def test_max_dice_sides_limit():
     with pytest.raises(ValueError, match=ErrorMessages.INVALID_DICE_SIDES):
         roll_dice(excessive_sides_string)
 
+def test_zero_dice_sides():
+    """
+    Test that dice with no sides raise a ValueError rather than rolling.
+    """
+    # Act & Assert
+    for dice_string in ["1D0", "2D0", "(1D0+1)*2"]:
+        with pytest.raises(ValueError, match=ErrorMessages.INVALID_DICE_SIDES):
+            roll_dice(dice_string)
+    with pytest.raises(ValueError, match=ErrorMessages.INVALID_DICE_SIDES):
+        roll_die(0)
+
 def test_percentile_dice_roll():
     """
     Test rolling a percentile dice (1D100).
     """
     # Arrange
-    dice_string = DiceConstants.StandardDice.PERCENTILE.value
+    dice_string = DiceConstants.StandardDice.PERCENTILE
 
     # Act
     result = roll_dice(dice_string)
@@ -159,6 +172,31 @@ def test_percentile_dice_roll():
     assert isinstance(result, int)
     assert 1 <= result <= 100
 
+def test_roll_percentile():
+    """
+    Test that the dedicated percentile roller stays within 1-100.
+    """
+    # Act
+    rolls = [roll_percentile() for _ in range(1000)]
+
+    # Assert
+    assert all(isinstance(roll, int) for roll in rolls)
+    assert min(rolls) >= 1
+    assert max(rolls) <= DiceConstants.PERCENTILE_SIDES
+
+def test_roll_percentile_follows_seed():
+    """
+    Test that reseeding the random module reproduces the same percentile rolls.
+    """
+    # Act
+    random.seed(7)
+    first = [roll_percentile() for _ in range(10)]
+    random.seed(7)
+    second = [roll_percentile() for _ in range(10)]
+
+    # Assert
+    assert first == second
+
 def test_randomness_distribution():
     """
     Simple statistical test to ensure some level of randomness.
@@ -175,4 +213,112 @@ def test_randomness_distribution():
     # Check that distribution is somewhat even (not perfectly, but reasonably)
     import statistics
     mean = statistics.mean(rolls)
-    assert 3.0 <= mean <= 4.0  # Expected mean for 1D6
\ No newline at end of file
+    assert 3.0 <= mean <= 4.0  # Expected mean for 1D6
+
+def test_parse_dice_components():
+    """
+    Test that parse_dice splits notation into dice count, sides,
+    signed modifier and multiplier without rolling.
+    """
+    # Act & Assert
+    assert parse_dice("3D6") == (3, 6, 0, 1)
+    assert parse_dice("1D20+3") == (1, 20, 3, 1)
+    assert parse_dice("4D4-1") == (4, 4, -1, 1)
+    assert parse_dice("(2D6+6)*5") == (2, 6, 6, 5)
+    assert parse_dice("1D3+1D4") is None
+
+def test_parse_dice_plain_notation():
+    """
+    Test that plain "NDK" notation parses the same with either case of D
+    and that incomplete or padded notation is still rejected.
+    """
+    # Act & Assert
+    assert parse_dice("2D10") == (2, 10, 0, 1)
+    assert parse_dice("2d10") == (2, 10, 0, 1)
+    assert parse_dice("2D") is None
+    assert parse_dice("D6") is None
+    assert parse_dice(" 2D10") is None
+
+def test_is_valid_dice():
+    """
+    Test that is_valid_dice accepts rollable notation and rejects
+    malformed strings, dice without sides or dice beyond the system limits.
+    """
+    # Act & Assert
+    assert is_valid_dice("1D100")
+    assert not is_valid_dice("Special Damage")
+    assert not is_valid_dice("1D0")
+    assert not is_valid_dice("(1D0+1)*2")
+    assert not is_valid_dice(f"{SystemLimits.MAX_DICE_COUNT + 1}D6")
+    assert not is_valid_dice(f"3D{SystemLimits.MAX_DICE_SIDES + 1}")
+
+def test_standard_dice_are_valid():
+    """
+    Test that every standard die is plain dice notation that can be rolled.
+    """
+    # Act & Assert
+    for dice_string in DiceConstants.ALL_STANDARD_DICE:
+        assert isinstance(dice_string, str)
+        assert is_valid_dice(dice_string)
+
+def test_standard_dice_roll_details():
+    """
+    Test that rolling a standard single die returns one roll within its
+    sides, both as a total and with details.
+    """
+    # Act & Assert
+    for dice_string in DiceConstants.ALL_STANDARD_DICE:
+        sides = parse_dice(dice_string)[1]
+        assert 1 <= roll_dice(dice_string) <= sides
+
+        result = roll_dice(dice_string, return_details=True)
+        assert result["rolls"] == [result["total"]]
+        assert 1 <= result["total"] <= sides
+
+def test_roll_die_covers_every_face():
+    """
+    Test that roll_die stays within the die's sides and can roll every face,
+    for dice with and without a power-of-two number of sides.
+    """
+    # Act & Assert
+    for sides in (1, 3, 4, 6, 8, 20):
+        rolls = {roll_die(sides) for _ in range(1000)}
+        assert rolls == set(range(1, sides + 1))
+
+def test_single_die_notation_uses_roll_die():
+    """
+    Test that single-die notation outside the standard dice, with or without
+    a modifier and multiplier, is rolled through roll_die.
+    """
+    # Arrange
+    with patch('src.dice_roll.roll_die', return_value=3) as mock_roll_die:
+        # Act & Assert
+        assert roll_dice("1D3", return_details=True) == {"total": 3, "rolls": [3]}
+        assert roll_dice("1D6+2") == 5
+        assert roll_dice("(1D4+1)*2") == 8
+        assert [call.args for call in mock_roll_die.call_args_list] == [(3,), (6,), (4,)]
+
+def test_power_of_two_dice_use_random_bits():
+    """
+    Test that several power-of-two dice are rolled from one random draw per
+    die, each one below the face rolled.
+    """
+    # Arrange
+    with patch('random.getrandbits', side_effect=[7, 0, 3]) as mock_getrandbits:
+        # Act
+        result = roll_dice("3D8", return_details=True)
+
+    # Assert
+    assert result == {"total": 13, "rolls": [8, 1, 4]}
+    assert [call.args for call in mock_getrandbits.call_args_list] == [(3,), (3,), (3,)]
+
+def test_power_of_two_dice_range():
+    """
+    Test that several power-of-two dice stay within, and reach, their
+    lowest and highest totals.
+    """
+    # Act
+    totals = {roll_dice("2D4") for _ in range(2000)}
+
+    # Assert
+    assert totals == set(range(2, 9))
@@ -83,6 +83,25 @@ def test_load_character_from_json(sample_character_data):
     # Assert
     assert character_data == sample_character_data
 
+def test_load_character_from_json_interns_keys():
+    """
+    Test that keys of loaded character data are interned strings, including
+    keys of nested objects such as skills.
+    """
+    # Arrange
+    json_string = '{"name": "Test Character", "skills": {"Spot Hidden": 40}}'
+    m = mock_open(read_data=json_string)
+
+    # Act
+    with patch('builtins.open', m):
+        character_data = load_character_from_json("test_character.json")
+
+    # Assert
+    name_key = next(iter(character_data))
+    skill_key = next(iter(character_data[CharacterSheetKeys.SKILLS]))
+    assert name_key is sys.intern(CharacterSheetKeys.NAME)
+    assert skill_key is sys.intern("Spot Hidden")
+
 def test_load_character_from_json_file_not_found():
     """
     Test error handling when the JSON file is not found.